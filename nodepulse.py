@@ -7,14 +7,19 @@ A beautiful terminal UI for monitoring your Bitcoin node in real-time.
 import json
 import subprocess
 import os
+import re
 import sys
 import shutil
 import platform
+import time
 import psutil
 import asyncio
-from datetime import datetime, timedelta
+import itertools
+from array import array
+from datetime import datetime
 from pathlib import Path
-from collections import deque
+from collections import Counter, deque
+from typing import NamedTuple
 
 # TOML config support (Python 3.11+ has tomllib built-in)
 try:
@@ -25,6 +30,24 @@ except ImportError:
     except ImportError:
         tomllib = None
 
+# Fast JSON parsing (optional, falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Direct JSON-RPC over HTTP (optional, falls back to bitcoin-cli)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# libuv-based event loop (optional, not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
@@ -37,6 +60,53 @@ from rich.progress import BarColumn, Progress, TaskID
 from rich.table import Table
 
 
+# NodePulse config file locations, in order of precedence
+NODEPULSE_CONFIG_PATHS = [
+    Path.home() / ".config" / "nodepulse" / "config.toml",
+    Path.home() / ".nodepulse" / "config.toml",
+]
+
+# Last-known-good dashboard data, painted on startup before the first RPC round-trip
+NODEPULSE_SNAPSHOT_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "nodepulse" / "snapshot.json"
+)
+
+
+def _json_loads(data):
+    """
+    Parse a JSON payload from bitcoind.
+
+    RPC output is always UTF-8, so the raw bytes are handed to the parser
+    as-is; decoding to str first would just add a copy of the payload.
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Responses larger than this (e.g. getpeerinfo on a busy node) are parsed in a worker thread
+_THREAD_PARSE_BYTES = 64 * 1024
+
+
+async def _json_loads_async(data):
+    """Parse a JSON payload, off the event loop when it is large"""
+    if len(data) > _THREAD_PARSE_BYTES:
+        return await asyncio.to_thread(_json_loads, data)
+    return _json_loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize a JSON-RPC request body to UTF-8 bytes"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _ok(result, default=None):
+    """Map an exception returned by gather(return_exceptions=True) to a default"""
+    return default if isinstance(result, BaseException) else result
+
+
 class BitcoinCliDetector:
     """Intelligent detection of bitcoin-cli location"""
 
@@ -60,12 +130,7 @@ class BitcoinCliDetector:
             return env_path, "environment variable BITCOIN_CLI_PATH"
 
         # 2. Check config file
-        config_paths = [
-            Path.home() / ".config" / "nodepulse" / "config.toml",
-            Path.home() / ".nodepulse" / "config.toml",
-        ]
-
-        for config_path in config_paths:
+        for config_path in NODEPULSE_CONFIG_PATHS:
             if config_path.exists() and tomllib:
                 try:
                     with open(config_path, 'rb') as f:
@@ -140,6 +205,35 @@ class BitcoinCliDetector:
         # Not found anywhere
         return None, None
 
+    @staticmethod
+    def load_config():
+        """Load the first readable NodePulse config file, or {} if there is none"""
+        if not tomllib:
+            return {}
+
+        for config_path in NODEPULSE_CONFIG_PATHS:
+            if config_path.exists():
+                try:
+                    with open(config_path, 'rb') as f:
+                        return tomllib.load(f)
+                except Exception:
+                    pass
+        return {}
+
+    @staticmethod
+    def find_datadir():
+        """Find the Bitcoin Core data directory (config file `datadir` or platform default)"""
+        datadir = BitcoinCliDetector.load_config().get('bitcoin', {}).get('datadir')
+        if datadir:
+            return Path(os.path.expanduser(datadir))
+
+        system = platform.system()
+        if system == "Darwin":
+            return Path.home() / "Library" / "Application Support" / "Bitcoin"
+        elif system == "Windows":
+            return Path(os.getenv('APPDATA', '')) / "Bitcoin"
+        return Path.home() / ".bitcoin"
+
     @staticmethod
     def get_detection_message(path, method):
         """Generate user-friendly detection message"""
@@ -203,6 +297,9 @@ class ConfirmDialog(ModalScreen):
 class BitcoinNodeController:
     """Controls for starting/stopping Bitcoin node"""
 
+    # Seconds to reuse the last is_running() result
+    RUNNING_CACHE_TTL = 2.0
+
     def __init__(self, bitcoind_path=None, bitcoin_cli_path=None):
         # Use provided path or detect automatically
         if bitcoin_cli_path:
@@ -218,16 +315,36 @@ class BitcoinNodeController:
             cli_dir = Path(self.bitcoin_cli).parent
             self.bitcoind = str(cli_dir / "bitcoind")
 
+        # bitcoind writes its PID to the datadir while running
+        self.pid_file = BitcoinCliDetector.find_datadir() / "bitcoind.pid"
+        self._running_cache = (0.0, False)
+
     def is_running(self):
-        """Check if bitcoind is running"""
-        for proc in psutil.process_iter(['name', 'cmdline']):
-            try:
-                if 'bitcoind' in proc.info['name'].lower():
-                    return True
-                if proc.info['cmdline'] and any('bitcoind' in arg for arg in proc.info['cmdline']):
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        """Check if bitcoind is running (cached for RUNNING_CACHE_TTL seconds)"""
+        checked_at, running = self._running_cache
+        if time.monotonic() - checked_at < self.RUNNING_CACHE_TTL:
+            return running
+
+        running = self._check_running()
+        self._running_cache = (time.monotonic(), running)
+        return running
+
+    def invalidate_running_cache(self):
+        """Force the next is_running() call to check the process again"""
+        self._running_cache = (0.0, False)
+
+    def _check_running(self):
+        """Check the PID file first, scanning the process list only if that fails"""
+        try:
+            if psutil.pid_exists(int(self.pid_file.read_text().strip())):
+                return True
+        except (OSError, ValueError):
+            pass
+
+        # Only the process name is needed, fetching cmdline costs extra syscalls
+        for proc in psutil.process_iter(['name']):
+            if 'bitcoind' in (proc.info['name'] or '').lower():
+                return True
         return False
 
     async def start_node(self):
@@ -244,6 +361,8 @@ class BitcoinNodeController:
             return process.returncode == 0, output
         except Exception as e:
             return False, str(e)
+        finally:
+            self.invalidate_running_cache()
 
     async def stop_node(self):
         """Stop bitcoind daemon"""
@@ -258,6 +377,8 @@ class BitcoinNodeController:
             return process.returncode == 0, output
         except Exception as e:
             return False, str(e)
+        finally:
+            self.invalidate_running_cache()
 
     async def get_uptime(self):
         """Get node uptime in seconds"""
@@ -275,8 +396,133 @@ class BitcoinNodeController:
         return None
 
 
+class BitcoinRPC:
+    """Persistent JSON-RPC connection to bitcoind over HTTP (requires aiohttp)"""
+
+    # Parallel keep-alive sockets, so concurrent calls reach separate bitcoind RPC worker threads
+    MAX_CONNECTIONS = 8
+
+    def __init__(self, url, datadir, user=None, password=None):
+        self.url = url
+        self.datadir = datadir
+        self.user = user
+        self.password = password
+        self._session = None
+        self._ids = itertools.count()
+
+    def _get_auth(self):
+        """Return RPC credentials from config or bitcoind's .cookie file"""
+        if self.user and self.password:
+            return aiohttp.BasicAuth(self.user, self.password)
+
+        try:
+            cookie = (self.datadir / ".cookie").read_text().strip()
+            user, password = cookie.split(':', 1)
+            return aiohttp.BasicAuth(user, password)
+        except (OSError, ValueError):
+            return None
+
+    def _get_session(self):
+        """Return the keep-alive session, creating it on first use"""
+        if aiohttp is None:
+            return None
+
+        if self._session is None or self._session.closed:
+            auth = self._get_auth()
+            if auth is None:
+                return None
+            self._session = aiohttp.ClientSession(
+                auth=auth,
+                # Resolve rpc_host once per session rather than every 10 s (aiohttp's default DNS TTL)
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONNECTIONS, keepalive_timeout=60, ttl_dns_cache=None
+                ),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        return self._session
+
+    def is_available(self):
+        """Check if JSON-RPC can be used (aiohttp installed and credentials found)"""
+        return self._get_session() is not None
+
+    async def batch_call(self, calls):
+        """
+        Send [(method, params), ...] to bitcoind as a single JSON-RPC batch.
+
+        Returns a list of results in call order, with None for failed calls.
+        Raises aiohttp.ClientConnectorError when bitcoind can't be reached.
+        """
+        results = [None] * len(calls)
+        session = self._get_session()
+        if session is None:
+            return results
+
+        ids = [next(self._ids) for _ in calls]
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in zip(ids, calls)
+        ]
+        body = _json_dumps(payload)
+
+        try:
+            async with session.post(self.url, data=body) as resp:
+                if resp.status == 401:
+                    # Cookie is regenerated on every bitcoind restart, re-read it next time
+                    await session.close()
+                    return results
+                responses = await _json_loads_async(await resp.read())
+        except aiohttp.ClientConnectorError:
+            # Couldn't connect at all; let the caller fall back to bitcoin-cli
+            raise
+        except Exception:
+            return results
+
+        if not isinstance(responses, list):
+            return results
+
+        index = {request_id: i for i, request_id in enumerate(ids)}
+        for response in responses:
+            i = index.get(response.get("id"))
+            if i is not None and response.get("error") is None:
+                results[i] = response.get("result")
+        return results
+
+    async def call(self, method, *params):
+        """Execute a single RPC call, returning None on failure"""
+        results = await self.batch_call([(method, list(params))])
+        return results[0]
+
+    async def close(self):
+        """Close the keep-alive session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
 class BitcoinNodeData:
-    """Handles communication with Bitcoin Core via bitcoin-cli"""
+    """Handles communication with Bitcoin Core via JSON-RPC (bitcoin-cli as fallback)"""
+
+    # RPC calls made on every refresh tick, keyed by snapshot field
+    SNAPSHOT_CALLS = {
+        'blockchain': ("getblockchaininfo", []),
+        'network': ("getnetworkinfo", []),
+        'peers': ("getpeerinfo", []),
+        'mempool': ("getmempoolinfo", []),
+        'uptime': ("uptime", []),
+        'fee_1': ("estimatesmartfee", [1]),
+        'fee_3': ("estimatesmartfee", [3]),
+        'fee_6': ("estimatesmartfee", [6]),
+    }
+
+    # getpeerinfo fields kept in memory; the rest of each peer entry is dropped on receipt
+    PEER_FIELDS = ("addr", "subver", "inbound", "pingtime", "bytessent", "bytesrecv", "synced_blocks")
+
+    # Seconds a successful RPC result is reused before asking the node again. Only
+    # slow-moving calls are cached; chain/network state is re-read on every tick
+    CACHE_TTL = {
+        'estimatesmartfee': 30.0,  # fee estimates move slowly
+        'getblock': 600.0,  # block contents never change for a given hash
+    }
 
     def __init__(self, bitcoin_cli_path=None):
         # Use provided path or detect automatically
@@ -286,6 +532,107 @@ class BitcoinNodeData:
             detected_cli, _ = BitcoinCliDetector.find_bitcoin_cli()
             self.bitcoin_cli = detected_cli or os.path.expanduser("~/bin/bitcoin-cli")
 
+        # JSON-RPC endpoint and credentials (cookie auth unless configured)
+        bitcoin_config = BitcoinCliDetector.load_config().get('bitcoin', {})
+        rpc_host = bitcoin_config.get('rpc_host', '127.0.0.1')
+        datadir = BitcoinCliDetector.find_datadir()
+        rpc_port = bitcoin_config.get('rpc_port')
+        if rpc_port is None:
+            # Otherwise use bitcoind's own rpcport= from bitcoin.conf, as bitcoin-cli does
+            rpc_port = BitcoinConfigManager(datadir / "bitcoin.conf").read_main_rpcport() or 8332
+        self.rpc = BitcoinRPC(
+            f"http://{rpc_host}:{rpc_port}/",
+            datadir,
+            user=bitcoin_config.get('rpc_user'),
+            password=bitcoin_config.get('rpc_password'),
+        )
+
+        # (method, params) -> (expiry, result)
+        self._cache = {}
+
+    def _cache_get(self, method, params):
+        """Return a cached result that hasn't expired yet, or None"""
+        entry = self._cache.get((method, params))
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, method, params, result):
+        """Cache a successful result for its method's TTL"""
+        ttl = self.CACHE_TTL.get(method)
+        if ttl is None or result is None:
+            return
+        now = time.monotonic()
+        if len(self._cache) > 64:
+            # Drop expired entries (e.g. old block lookups) so the cache stays small
+            self._cache = {key: entry for key, entry in self._cache.items() if entry[0] > now}
+        self._cache[method, params] = (now + ttl, result)
+
+    def cache_invalidate(self):
+        """Forget all cached results so the next calls go to the node"""
+        self._cache.clear()
+
+    async def call(self, method, *params):
+        """Execute a single RPC call, via JSON-RPC or bitcoin-cli"""
+        result = self._cache_get(method, params)
+        if result is not None:
+            return result
+
+        result, = await self._batch([(method, list(params))])
+        self._cache_put(method, params, result)
+        return result
+
+    async def get_dashboard_snapshot(self, names=None):
+        """
+        Fetch per-tick RPC data, batched into one request when possible.
+
+        names limits the fetch to those SNAPSHOT_CALLS fields; the rest are None.
+        """
+        if names is None:
+            names = self.SNAPSHOT_CALLS
+        snapshot = dict.fromkeys(self.SNAPSHOT_CALLS)
+        missing = {}
+        for name in names:
+            method, params = self.SNAPSHOT_CALLS[name]
+            result = self._cache_get(method, tuple(params))
+            if result is None:
+                missing[name] = (method, params)
+            else:
+                snapshot[name] = result
+
+        if missing:
+            results = await self._batch(list(missing.values()))
+            for (name, (method, params)), result in zip(missing.items(), results):
+                if name == 'peers' and result:
+                    result = self._compact_peers(result)
+                self._cache_put(method, tuple(params), result)
+                snapshot[name] = result
+        return snapshot
+
+    async def _batch(self, calls):
+        """
+        Run [(method, params), ...] over JSON-RPC, or through bitcoin-cli when
+        JSON-RPC isn't set up or nothing answers at its URL.
+        """
+        if self.rpc.is_available():
+            try:
+                return await self.rpc.batch_call(calls)
+            except aiohttp.ClientConnectorError:
+                # Wrong host/port or bitcoind not listening; bitcoin-cli reads bitcoin.conf itself
+                pass
+        return await asyncio.gather(
+            *[self.run_command(method, *map(str, params)) for method, params in calls]
+        )
+
+    @classmethod
+    def _compact_peers(cls, peers):
+        """Keep only PEER_FIELDS from each getpeerinfo entry"""
+        return [{key: peer[key] for key in cls.PEER_FIELDS if key in peer} for peer in peers]
+
+    async def close(self):
+        """Close the JSON-RPC connection"""
+        await self.rpc.close()
+
     async def run_command(self, *args):
         """Execute bitcoin-cli command and return JSON result (async)"""
         try:
@@ -297,40 +644,68 @@ class BitcoinNodeData:
             )
             stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
             if process.returncode == 0:
-                return json.loads(stdout.decode())
+                return await _json_loads_async(stdout)
             return None
         except Exception as e:
             return None
 
     async def get_blockchain_info(self):
-        return await self.run_command("getblockchaininfo")
+        return await self.call("getblockchaininfo")
 
     async def get_network_info(self):
-        return await self.run_command("getnetworkinfo")
+        return await self.call("getnetworkinfo")
 
     async def get_peer_info(self):
-        return await self.run_command("getpeerinfo")
+        peers = await self.call("getpeerinfo")
+        return self._compact_peers(peers) if peers else peers
 
     async def get_mempool_info(self):
-        return await self.run_command("getmempoolinfo")
+        return await self.call("getmempoolinfo")
 
     async def estimate_smart_fee(self, conf_target):
-        return await self.run_command("estimatesmartfee", str(conf_target))
+        return await self.call("estimatesmartfee", conf_target)
 
     async def get_block_hash(self, height):
-        return await self.run_command("getblockhash", str(height))
+        return await self.call("getblockhash", height)
 
     async def get_block(self, block_hash):
-        return await self.run_command("getblock", block_hash, "1")
+        return await self.call("getblock", block_hash, 1)
 
     async def get_uptime(self):
         """Get node uptime in seconds"""
-        result = await self.run_command("uptime")
+        result = await self.call("uptime")
         if result is not None:
             return result
         return 0
 
 
+class BlockchainSnapshot(NamedTuple):
+    """The getblockchaininfo fields the refresh loop reads on every tick"""
+    blocks: int
+    headers: int
+    is_syncing: bool
+
+    @classmethod
+    def from_rpc(cls, info):
+        return cls(
+            info.get("blocks", 0),
+            info.get("headers", 0),
+            info.get("initialblockdownload", False),
+        )
+
+
+# key=value lines in bitcoin.conf (comments, blank lines and [sections] don't match)
+_CONF_RE = re.compile(r'^[ \t]*([A-Za-z0-9_.-]+)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# Validated bitcoin.conf settings: key -> (minimum, maximum, extra allowed values)
+_VALIDATORS = {
+    'prune': (550, None, {0}),
+    'maxconnections': (8, 125, None),
+    'dbcache': (4, 16384, None),
+    'rpcport': (1024, 65535, None),
+}
+
+
 class BitcoinConfigManager:
     """Manages Bitcoin Core configuration file (bitcoin.conf)"""
 
@@ -340,80 +715,105 @@ class BitcoinConfigManager:
         else:
             self.config_path = Path.home() / "Library" / "Application Support" / "Bitcoin" / "bitcoin.conf"
 
+        # Last parsed settings, keyed on the file's mtime
+        self._cached_mtime = None
+        self._cached_settings = {}
+
     def read_config(self):
         """Read and parse bitcoin.conf, returning a dict of settings"""
         settings = {}
 
-        if not self.config_path.exists():
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except OSError:
             return settings
 
+        # Reuse the last parse while the file is unchanged on disk
+        if mtime == self._cached_mtime:
+            return dict(self._cached_settings)
+
         try:
-            with open(self.config_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # Parse key=value pairs
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        settings[key.strip()] = value.strip()
+            content = self.config_path.read_text()
         except Exception as e:
             return settings
 
-        return settings
+        # Parse key=value pairs in a single pass over the file
+        for match in _CONF_RE.finditer(content):
+            settings[match.group(1)] = match.group(2)
+
+        self._cached_mtime = mtime
+        self._cached_settings = settings
+        return dict(settings)
+
+    def read_main_rpcport(self):
+        """
+        Return the mainnet rpcport from bitcoin.conf, or None.
+
+        Unlike read_config this honours sections, so an rpcport under
+        [test], [signet] or [regtest] doesn't apply to mainnet.
+        """
+        try:
+            content = self.config_path.read_text()
+        except OSError:
+            return None
+
+        port = None
+        section = "main"
+        for line in content.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("["):
+                section = stripped.strip("[]").strip()
+                continue
+            match = _CONF_RE.match(line)
+            if match and match.group(1) == "rpcport" and section == "main":
+                port = match.group(2)
+        return int(port) if port and port.isdecimal() else None
 
     def write_config(self, settings):
         """Write settings to bitcoin.conf, preserving structure and comments"""
         if not self.config_path.exists():
             return False, "Config file not found"
 
+        # Write next to the real file so a symlinked bitcoin.conf stays a symlink
+        config_path = self.config_path.resolve()
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
+
         try:
             # Create backup first
             self.backup_config()
 
-            # Read current file to preserve comments
-            with open(self.config_path, 'r') as f:
-                lines = f.readlines()
-
-            # Update lines with new settings
-            new_lines = []
+            # Stream the current file into a temp file, preserving comments
             updated_keys = set()
 
-            for line in lines:
-                stripped = line.strip()
-
-                # Keep comments and empty lines
-                if not stripped or stripped.startswith('#'):
-                    new_lines.append(line)
-                    continue
-
-                # Update existing settings
-                if '=' in stripped:
-                    key = stripped.split('=', 1)[0].strip()
-                    if key in settings:
-                        # Update this setting
-                        new_lines.append(f"{key}={settings[key]}\n")
+            # Create the temp file private, and give it the original permissions before any content goes in
+            with open(config_path, 'r') as src, \
+                    open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as dst:
+                shutil.copymode(config_path, tmp_path)
+                for line in src:
+                    match = _CONF_RE.match(line)
+
+                    # Update existing settings
+                    if match and match.group(1) in settings:
+                        key = match.group(1)
+                        dst.write(f"{key}={settings[key]}\n")
                         updated_keys.add(key)
                     else:
-                        # Keep original line
-                        new_lines.append(line)
-                else:
-                    new_lines.append(line)
+                        # Keep comments, empty lines and other settings
+                        dst.write(line)
 
-            # Add new settings that weren't in the file
-            for key, value in settings.items():
-                if key not in updated_keys:
-                    new_lines.append(f"\n# Added by NodePulse\n{key}={value}\n")
+                # Add new settings that weren't in the file
+                for key, value in settings.items():
+                    if key not in updated_keys:
+                        dst.write(f"\n# Added by NodePulse\n{key}={value}\n")
 
-            # Write back to file
-            with open(self.config_path, 'w') as f:
-                f.writelines(new_lines)
+            # Atomically swap the file in
+            os.replace(tmp_path, config_path)
+            self._cached_mtime = None
 
             return True, "Configuration saved successfully"
 
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             return False, f"Error writing config: {str(e)}"
 
     def backup_config(self):
@@ -425,26 +825,27 @@ class BitcoinConfigManager:
         backup_path = self.config_path.parent / f"bitcoin.conf.backup.{timestamp}"
 
         try:
-            import shutil
-            shutil.copy2(self.config_path, backup_path)
+            # copy, not copyfile: keep the 0600 mode that guards RPC credentials
+            shutil.copy(self.config_path, backup_path)
         except:
             pass
 
     def validate_setting(self, key, value):
         """Validate configuration values"""
-        validations = {
-            'prune': lambda v: v == '0' or (v.isdigit() and int(v) >= 550),
-            'maxconnections': lambda v: v.isdigit() and 8 <= int(v) <= 125,
-            'dbcache': lambda v: v.isdigit() and 4 <= int(v) <= 16384,
-            'rpcport': lambda v: v.isdigit() and 1024 <= int(v) <= 65535,
-        }
+        spec = _VALIDATORS.get(key)
+        if spec is None:
+            return True, "Valid"
 
-        if key in validations:
-            try:
-                if not validations[key](str(value)):
-                    return False, f"Invalid value for {key}"
-            except:
-                return False, f"Invalid value for {key}"
+        value = str(value)
+        if not value.isdecimal():
+            return False, f"Invalid value for {key}"
+
+        minimum, maximum, allowed = spec
+        number = int(value)
+        if allowed and number in allowed:
+            return True, "Valid"
+        if (minimum is not None and number < minimum) or (maximum is not None and number > maximum):
+            return False, f"Invalid value for {key}"
 
         return True, "Valid"
 
@@ -464,69 +865,93 @@ class SyncStatsTracker:
 
     def __init__(self, max_history=60):
         self.max_history = max_history
-        self.history = deque(maxlen=max_history)
-        self.start_time = datetime.now()
+        # History as preallocated ring buffers, one array per field
+        self.times = array('d', [0.0]) * max_history
+        self.blocks = array('q', [0]) * max_history
+        self.headers = array('q', [0]) * max_history
+        self.cursor = 0
+        self.count = 0
+        self.start_time = time.monotonic()
         self.initial_blocks = None
+        self.latest_blocks = None
         self.was_syncing = None
+        self.bph = 0
 
     def update(self, blocks, headers, is_syncing):
         """Update with new data point"""
-        now = datetime.now()
+        now = time.monotonic()
 
         if self.initial_blocks is None:
             self.initial_blocks = blocks
 
         sync_completed = self.was_syncing and not is_syncing
         self.was_syncing = is_syncing
+        self.latest_blocks = blocks
 
-        self.history.append({
-            'time': now,
-            'blocks': blocks,
-            'headers': headers,
-            'is_syncing': is_syncing
-        })
+        i = self.cursor
+        self.times[i] = now
+        self.blocks[i] = blocks
+        self.headers[i] = headers
+        self.cursor = (i + 1) % self.max_history
+        self.count = min(self.count + 1, self.max_history)
 
-        return sync_completed
+        self.bph = self._calculate_blocks_per_hour()
 
-    def get_blocks_per_hour(self):
-        """Calculate blocks per hour"""
-        if len(self.history) < 2:
-            return 0
+        return sync_completed
 
-        recent_data = list(self.history)[-12:]
-        if len(recent_data) < 2:
+    def _calculate_blocks_per_hour(self):
+        """Calculate blocks per hour as the least-squares slope over the last 12 data points"""
+        n = min(12, self.count)
+        if n < 2:
             return 0
 
-        oldest = recent_data[0]
-        newest = recent_data[-1]
-
-        time_diff = (newest['time'] - oldest['time']).total_seconds() / 3600
-        if time_diff == 0:
+        # Offsets from the oldest sample keep the sums small and exact enough
+        oldest = (self.cursor - n) % self.max_history
+        t0 = self.times[oldest]
+        b0 = self.blocks[oldest]
+
+        sum_t = sum_b = sum_tt = sum_tb = 0.0
+        for k in range(self.cursor - n, self.cursor):
+            i = k % self.max_history
+            t = self.times[i] - t0
+            b = self.blocks[i] - b0
+            sum_t += t
+            sum_b += b
+            sum_tt += t * t
+            sum_tb += t * b
+
+        denom = n * sum_tt - sum_t * sum_t
+        if denom == 0:
             return 0
+        return (n * sum_tb - sum_t * sum_b) / denom * 3600
 
-        block_diff = newest['blocks'] - oldest['blocks']
-        return block_diff / time_diff
+    def get_blocks_per_hour(self):
+        """Get blocks per hour (updated on every data point)"""
+        return self.bph
 
     def get_eta(self, current_blocks, total_headers):
-        """Estimate time to completion"""
-        bph = self.get_blocks_per_hour()
+        """Estimate hours to completion"""
+        bph = self.bph
         if bph == 0 or current_blocks >= total_headers:
             return None
 
         blocks_remaining = total_headers - current_blocks
-        hours_remaining = blocks_remaining / bph
-
-        return timedelta(hours=hours_remaining)
+        return blocks_remaining / bph
 
     def get_uptime(self):
-        """Get time since tracking started"""
-        return datetime.now() - self.start_time
+        """Get seconds since tracking started"""
+        return time.monotonic() - self.start_time
 
     def get_blocks_synced(self):
         """Get total blocks synced since start"""
-        if not self.history or self.initial_blocks is None:
+        if self.latest_blocks is None or self.initial_blocks is None:
             return 0
-        return self.history[-1]['blocks'] - self.initial_blocks
+        return self.latest_blocks - self.initial_blocks
+
+
+def _is_shown(widget):
+    """Check whether a widget is displayed, i.e. its tab pane is the active one"""
+    return all(node.display for node in widget.ancestors_with_self)
 
 
 class ClickableLabel(Label):
@@ -540,11 +965,15 @@ class ClickableLabel(Label):
 
     def on_enter(self) -> None:
         """Mouse entered the label"""
+        if self.is_hovered:
+            return
         self.is_hovered = True
         self.update(self.hover_text)
 
     def on_leave(self) -> None:
         """Mouse left the label"""
+        if not self.is_hovered:
+            return
         self.is_hovered = False
         self.update(self.normal_text)
 
@@ -561,10 +990,14 @@ class ClickableLabel(Label):
 class ControlsPanel(Static):
     """Display node controls"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self, controller, alerts_panel):
         super().__init__()
         self.controller = controller
         self.alerts_panel = alerts_panel
+        self._render_key = None
+        self._dirty = False
 
     def compose(self) -> ComposeResult:
         """Create control widgets"""
@@ -605,8 +1038,30 @@ class ControlsPanel(Static):
 
     async def update_status(self) -> None:
         """Update node status display"""
-        is_running = self.controller.is_running()
-        uptime = await self.controller.get_uptime()
+        # Don't poll while the Controls tab is hidden, catch up when it's shown
+        if not _is_shown(self):
+            self._dirty = True
+            return
+        self._dirty = False
+
+        # Check the process and query uptime concurrently
+        results = await asyncio.gather(
+            asyncio.to_thread(self.controller.is_running),
+            self.controller.get_uptime(),
+            return_exceptions=True
+        )
+        is_running, uptime = _ok(results[0], False), _ok(results[1], 0)
+
+        hours = minutes = None
+        if is_running and uptime:
+            hours = uptime // 3600
+            minutes = (uptime % 3600) // 60
+
+        # Skip the rebuild when nothing visible has changed
+        render_key = (is_running, hours, minutes)
+        if render_key == self._render_key:
+            return
+        self._render_key = render_key
 
         table = Table.grid(padding=(0, 2))
         table.add_column(justify="left", style="cyan")
@@ -614,9 +1069,7 @@ class ControlsPanel(Static):
 
         if is_running:
             table.add_row("Node Status:", "[bold green]🟢 Running[/]")
-            if uptime:
-                hours = uptime // 3600
-                minutes = (uptime % 3600) // 60
+            if hours is not None:
                 table.add_row("Uptime:", f"[dim]{hours}h {minutes}m[/]")
         else:
             table.add_row("Node Status:", "[bold red]🔴 Stopped[/]")
@@ -641,18 +1094,16 @@ class ControlsPanel(Static):
         elif action_id == "action-restart":
             self.run_worker(self.restart_node())
         elif action_id == "action-refresh":
-            if self.alerts_panel:
-                self.alerts_panel.add_alert("Manual refresh triggered", "info")
-            self.app.refresh_data()
+            self.app.action_refresh()
         elif action_id == "action-clear":
             if self.alerts_panel:
-                self.alerts_panel.alerts = []
+                self.alerts_panel.alerts.clear()
                 self.alerts_panel.update_render()
                 self.alerts_panel.add_alert("Alerts cleared", "info")
 
     async def start_node(self) -> None:
         """Start the node"""
-        if self.controller.is_running():
+        if await asyncio.to_thread(self.controller.is_running):
             self.alerts_panel.add_alert("Node is already running", "warning")
             return
 
@@ -668,7 +1119,7 @@ class ControlsPanel(Static):
 
     async def stop_node(self) -> None:
         """Stop the node with confirmation"""
-        if not self.controller.is_running():
+        if not await asyncio.to_thread(self.controller.is_running):
             self.alerts_panel.add_alert("Node is not running", "warning")
             return
 
@@ -697,7 +1148,7 @@ class ControlsPanel(Static):
             self.alerts_panel.add_alert("Restarting node...", "info")
 
             # Stop first
-            if self.controller.is_running():
+            if await asyncio.to_thread(self.controller.is_running):
                 success, _ = await self.controller.stop_node()
                 if success:
                     self.alerts_panel.add_alert("Node stopped, waiting 3s...", "info")
@@ -713,15 +1164,85 @@ class ControlsPanel(Static):
             await self.update_status()
 
 
+# Byte-unit reciprocals for display conversions
+_INV_GB = 1.0 / (1024**3)
+_INV_MB = 1.0 / (1024**2)
+_INV_KB = 1.0 / 1024
+
+# Pre-rendered progress bars, indexed by the number of filled cells
+_BAR30 = tuple("█" * i + "░" * (30 - i) for i in range(31))
+_BAR40 = tuple("█" * i + "░" * (40 - i) for i in range(41))
+
+# Retro terminal banner
+_BANNER_TOP = "╔═══════════════════════════════════════════════════════════════════════════╗"
+_BANNER_BOT = "╚═══════════════════════════════════════════════════════════════════════════╝"
+
+# Retro ASCII Art Logo (more compact, terminal style)
+_LOGO = """
+        ░▒▓█  █▄  █  ████  █▀▄  █▀▀  █▀█  █  █  █    ▄▀▀  █▀▀  █▓▒░
+        ░▒▓█  █ ▀▄█  █  █  █ █  █▀   █▀▀  █  █  █     ▀▄  █▀   █▓▒░
+        ░▒▓█  █   █  ████  ▀▀   ▀▀▀  ▀    ▀▀▀   ▀▀▀  ▀▀   ▀▀▀  █▓▒░"""
+
+
+def _build_dashboard_header():
+    """Build the banner, logo and subtitle shown at the top of the dashboard"""
+    content = Text()
+    content.append(_BANNER_TOP + "\n", style="bold green")
+    content.append(_LOGO + "\n", style="bold cyan")
+    content.append(_BANNER_BOT + "\n", style="bold green")
+    content.append("\n")
+    content.append("        ▓▒░ BITCOIN CORE TERMINAL MONITORING SYSTEM ░▒▓\n", style="dim green italic")
+    content.append("\n")
+    return content
+
+
+def _build_dashboard_nav():
+    """Build the navigation menu with retro style (vertical list)"""
+    nav_table = Table.grid(padding=(0, 2))
+    nav_table.add_column(justify="left", style="bold cyan", width=35)
+    nav_table.add_column(justify="left", style="dim")
+
+    nav_table.add_row(
+        "[▓▒░ 1 ░▒▓] DASHBOARD",
+        "→ Overview, Quick Stats"
+    )
+    nav_table.add_row(
+        "[▓▒░ 2 ░▒▓] SYNC STATUS",
+        "→ Sync, Stats, Alerts"
+    )
+    nav_table.add_row(
+        "[▓▒░ 3 ░▒▓] BLOCKCHAIN INFO",
+        "→ Network, Storage, Pool"
+    )
+    nav_table.add_row(
+        "[▓▒░ 4 ░▒▓] NODE CONTROLS",
+        "→ Start, Stop, Restart"
+    )
+    nav_table.add_row(
+        "[▓▒░ 5 ░▒▓] SETTINGS",
+        "→ Bitcoin Core Configuration"
+    )
+    return nav_table
+
+
+# Static dashboard content, built once instead of on every refresh
+_DASHBOARD_HEADER = _build_dashboard_header()
+_DASHBOARD_SEPARATOR = Text("═" * 75, style="dim green")
+_DASHBOARD_NAV = _build_dashboard_nav()
+
+
 class DashboardPanel(Static):
     """Main dashboard with welcome screen and quick stats"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__("⚠️  Loading...")
         self.node_running = False
         self.blockchain_info = None
         self.network_info = None
         self.uptime = 0
+        self._render_key = None
 
     def update_data(self, node_running, blockchain_info, network_info, uptime):
         self.node_running = node_running
@@ -731,16 +1252,6 @@ class DashboardPanel(Static):
         self.update_render()
 
     def update_render(self):
-        # Retro terminal banner
-        banner_top = "╔═══════════════════════════════════════════════════════════════════════════╗"
-        banner_bot = "╚═══════════════════════════════════════════════════════════════════════════╝"
-
-        # Retro ASCII Art Logo (more compact, terminal style)
-        logo = """
-        ░▒▓█  █▄  █  ████  █▀▄  █▀▀  █▀█  █  █  █    ▄▀▀  █▀▀  █▓▒░
-        ░▒▓█  █ ▀▄█  █  █  █ █  █▀   █▀▀  █  █  █     ▀▄  █▀   █▓▒░
-        ░▒▓█  █   █  ████  ▀▀   ▀▀▀  ▀    ▀▀▀   ▀▀▀  ▀▀   ▀▀▀  █▓▒░"""
-
         # Node Status with retro indicators
         if self.node_running:
             node_status_text = "RUNNING"
@@ -758,14 +1269,13 @@ class DashboardPanel(Static):
             progress = self.blockchain_info.get("verificationprogress", 0) * 100
 
             # Create retro progress bar
-            bar_width = 30
-            filled = int((progress / 100) * bar_width)
-            sync_bar = "█" * filled + "░" * (bar_width - filled)
+            filled = min(30, int((progress / 100) * 30))
+            sync_bar = _BAR30[filled]
 
             sync_status = f"[cyan]{blocks:,}[/cyan] / [dim]{headers:,}[/dim]"
             sync_percent = f"[yellow]{progress:.1f}%[/yellow]"
         else:
-            sync_bar = "░" * 30
+            sync_bar = _BAR30[0]
             sync_status = "[dim]N/A[/dim]"
             sync_percent = "[dim]---[/dim]"
 
@@ -793,14 +1303,14 @@ class DashboardPanel(Static):
         else:
             uptime_str = "[dim]000h:00m[/dim]"
 
-        # Build retro content
-        content = Text()
-        content.append(banner_top + "\n", style="bold green")
-        content.append(logo + "\n", style="bold cyan")
-        content.append(banner_bot + "\n", style="bold green")
-        content.append("\n")
-        content.append("        ▓▒░ BITCOIN CORE TERMINAL MONITORING SYSTEM ░▒▓\n", style="dim green italic")
-        content.append("\n")
+        # Skip the rebuild when nothing visible has changed
+        render_key = (
+            node_status_text, uptime_str, core_version,
+            sync_status, sync_bar, sync_percent, peer_status, peer_visual
+        )
+        if render_key == self._render_key:
+            return
+        self._render_key = render_key
 
         # Status grid with retro styling
         status_table = Table.grid(padding=(0, 2))
@@ -851,46 +1361,17 @@ class DashboardPanel(Static):
             ""
         )
 
-        # Separator
-        separator = "═" * 75
-
-        # Navigation menu with retro style (vertical list)
-        nav_table = Table.grid(padding=(0, 2))
-        nav_table.add_column(justify="left", style="bold cyan", width=35)
-        nav_table.add_column(justify="left", style="dim")
-
-        nav_table.add_row(
-            "[▓▒░ 1 ░▒▓] DASHBOARD",
-            "→ Overview, Quick Stats"
-        )
-        nav_table.add_row(
-            "[▓▒░ 2 ░▒▓] SYNC STATUS",
-            "→ Sync, Stats, Alerts"
-        )
-        nav_table.add_row(
-            "[▓▒░ 3 ░▒▓] BLOCKCHAIN INFO",
-            "→ Network, Storage, Pool"
-        )
-        nav_table.add_row(
-            "[▓▒░ 4 ░▒▓] NODE CONTROLS",
-            "→ Start, Stop, Restart"
-        )
-        nav_table.add_row(
-            "[▓▒░ 5 ░▒▓] SETTINGS",
-            "→ Bitcoin Core Configuration"
-        )
-
         # Final assembly
         final_content = Table.grid()
         final_content.add_column(justify="center")
         final_content.add_row("")
-        final_content.add_row(content)
+        final_content.add_row(_DASHBOARD_HEADER)
         final_content.add_row("")
         final_content.add_row(status_table)
         final_content.add_row("")
-        final_content.add_row(Text(separator, style="dim green"))
+        final_content.add_row(_DASHBOARD_SEPARATOR)
         final_content.add_row("")
-        final_content.add_row(nav_table)
+        final_content.add_row(_DASHBOARD_NAV)
         final_content.add_row("")
 
         panel = Panel(final_content, border_style="bold green", padding=(1, 3))
@@ -900,9 +1381,12 @@ class DashboardPanel(Static):
 class SyncPanel(Static):
     """Display blockchain synchronization status"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__("⚠️  Waiting for node data...")
         self.blockchain_info = None
+        self._render_key = None
 
     def update_data(self, blockchain_info):
         self.blockchain_info = blockchain_info
@@ -910,6 +1394,7 @@ class SyncPanel(Static):
 
     def update_render(self):
         if not self.blockchain_info:
+            self._render_key = None
             self.update("⚠️  Waiting for node data...")
             return
 
@@ -919,14 +1404,19 @@ class SyncPanel(Static):
         ibd = self.blockchain_info.get("initialblockdownload", False)
         chain = self.blockchain_info.get("chain", "unknown")
         pruned = self.blockchain_info.get("pruned", False)
-        prune_size = self.blockchain_info.get("prune_target_size", 0) / (1024**3)
+        prune_size = self.blockchain_info.get("prune_target_size", 0) * _INV_GB
 
-        bar_width = 40
-        filled = int((progress / 100) * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        filled = min(40, int((progress / 100) * 40))
+        bar = _BAR40[filled]
 
         status = "🔄 Syncing" if ibd else "✅ Synced"
 
+        # Skip the rebuild when nothing visible has changed
+        render_key = (status, chain, blocks, headers, bar, f"{progress:.2f}", pruned, f"{prune_size:.1f}")
+        if render_key == self._render_key:
+            return
+        self._render_key = render_key
+
         table = Table.grid(padding=(0, 2))
         table.add_column(justify="left", style="cyan")
         table.add_column(justify="left")
@@ -946,13 +1436,17 @@ class SyncPanel(Static):
 class SyncStatsPanel(Static):
     """Display sync statistics and ETA"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__()
         self.stats = None
+        self._render_key = None
         self.update("⚠️  Waiting for sync data...")
 
     def update_data(self, tracker, blockchain_info):
         if not blockchain_info:
+            self._render_key = None
             self.update("⚠️  Waiting for sync data...")
             return
 
@@ -965,16 +1459,11 @@ class SyncStatsPanel(Static):
         uptime = tracker.get_uptime()
         blocks_synced = tracker.get_blocks_synced()
 
-        table = Table.grid(padding=(0, 2))
-        table.add_column(justify="left", style="cyan")
-        table.add_column(justify="left")
-
-        table.add_row("Speed:", f"[bold green]{bph:,.0f}[/] blocks/hour")
-
+        eta_str = None
         if is_syncing and eta:
-            days = eta.days
-            hours = eta.seconds // 3600
-            minutes = (eta.seconds % 3600) // 60
+            days, remainder = divmod(int(eta * 3600), 86400)
+            hours, remainder = divmod(remainder, 3600)
+            minutes = remainder // 60
 
             if days > 0:
                 eta_str = f"{days}d {hours}h"
@@ -983,12 +1472,26 @@ class SyncStatsPanel(Static):
             else:
                 eta_str = f"{minutes}m"
 
+        uptime_hours, remainder = divmod(int(uptime), 3600)
+        uptime_minutes = remainder // 60
+
+        # Skip the rebuild when nothing visible has changed
+        render_key = (f"{bph:,.0f}", eta_str, uptime_hours, uptime_minutes, blocks_synced)
+        if render_key == self._render_key:
+            return
+        self._render_key = render_key
+
+        table = Table.grid(padding=(0, 2))
+        table.add_column(justify="left", style="cyan")
+        table.add_column(justify="left")
+
+        table.add_row("Speed:", f"[bold green]{bph:,.0f}[/] blocks/hour")
+
+        if eta_str:
             table.add_row("ETA:", f"[yellow]{eta_str}[/]")
         else:
             table.add_row("ETA:", "[green]Synced![/]")
 
-        uptime_hours = int(uptime.total_seconds() // 3600)
-        uptime_minutes = int((uptime.total_seconds() % 3600) // 60)
         table.add_row("Uptime:", f"[dim]{uptime_hours}h {uptime_minutes}m[/]")
         table.add_row("Synced:", f"[dim]{blocks_synced:,} blocks[/]")
 
@@ -996,24 +1499,59 @@ class SyncStatsPanel(Static):
         self.update(panel)
 
 
+# Alert level -> (color, icon)
+_LEVEL_STYLE = {
+    'success': ('green', '✅'),
+    'warning': ('yellow', '⚠️'),
+    'error': ('red', '❌'),
+    'info': ('cyan', 'ℹ️'),
+}
+_DEFAULT_LEVEL_STYLE = ('white', '•')
+
+
+class Alert(NamedTuple):
+    """A single entry in the alerts panel"""
+    time: str
+    message: str
+    level: str
+
+
 class AlertsPanel(Static):
     """Display alerts and notifications"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__("[dim]Initializing alerts...[/]")
-        self.alerts = []
+        self._panel = Panel("", title="🔔 Alerts", border_style="yellow")
+        self.alerts = deque(maxlen=5)
+        self._render_key = None
+        self._dirty = False
+        self._ts_second = None
+        self._ts_str = ""
 
     def add_alert(self, message, level="info"):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.alerts.append({
-            'time': timestamp,
-            'message': message,
-            'level': level
-        })
-        self.alerts = self.alerts[-5:]
+        # Timestamp only changes once per second, so reuse the formatted string
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        self.alerts.append(Alert(self._ts_str, message, level))
         self.update_render()
 
     def update_render(self):
+        # Defer rendering while the Sync tab is hidden, catch up when it's shown
+        if not _is_shown(self):
+            self._dirty = True
+            return
+        self._dirty = False
+
+        # Skip the rebuild when the alert list is unchanged
+        render_key = tuple(self.alerts)
+        if render_key == self._render_key:
+            return
+        self._render_key = render_key
+
         table = Table.grid(padding=(0, 1))
         table.add_column(justify="left", style="dim")
         table.add_column(justify="left")
@@ -1022,39 +1560,42 @@ class AlertsPanel(Static):
             table.add_row("", "[dim]No alerts[/]")
         else:
             for alert in reversed(self.alerts):
-                level_color = {
-                    'success': 'green',
-                    'warning': 'yellow',
-                    'error': 'red',
-                    'info': 'cyan'
-                }.get(alert['level'], 'white')
-
-                icon = {
-                    'success': '✅',
-                    'warning': '⚠️',
-                    'error': '❌',
-                    'info': 'ℹ️'
-                }.get(alert['level'], '•')
+                level_color, icon = _LEVEL_STYLE.get(alert.level, _DEFAULT_LEVEL_STYLE)
 
                 table.add_row(
-                    f"[dim]{alert['time']}[/]",
-                    f"[{level_color}]{icon} {alert['message']}[/]"
+                    f"[dim]{alert.time}[/]",
+                    f"[{level_color}]{icon} {alert.message}[/]"
                 )
 
-        panel = Panel(table, title="🔔 Alerts", border_style="yellow")
-        self.update(panel)
+        # Reuse the panel frame, only the table inside changes
+        self._panel.renderable = table
+        self.update(self._panel)
+
+
+class Block(NamedTuple):
+    """Summary of a block shown in the recent blocks panel"""
+    height: int
+    hash: str
+    time: int
+    tx: int
+    size: float
 
 
 class RecentBlocksPanel(Static):
     """Display recently processed blocks"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__("⚠️  Waiting for blocks...")
+        self._panel = Panel("", title="📦 Recent Blocks", border_style="cyan")
         self.blocks = []
         self.cached_height = None
+        self._render_key = None
 
     async def update_data(self, bitcoin, current_height):
         if current_height == 0:
+            self._render_key = None
             self.update("⚠️  Waiting for blocks...")
             return
 
@@ -1062,33 +1603,44 @@ class RecentBlocksPanel(Static):
         if self.cached_height == current_height and self.blocks:
             return
 
-        self.cached_height = current_height
         blocks_to_show = 3  # Reduced from 5 to 3 for performance
         new_blocks = []
 
-        # Get all block hashes in parallel
+        async def _fetch(height):
+            # Chain hash -> block per height so each pipeline runs independently
+            block_hash = await bitcoin.get_block_hash(height)
+            if not block_hash:
+                return height, None, None
+            return height, block_hash, await bitcoin.get_block(block_hash)
+
         heights = [current_height - i for i in range(blocks_to_show) if current_height - i >= 0]
-        block_hashes = await asyncio.gather(*[bitcoin.get_block_hash(h) for h in heights])
-
-        # Get all block details in parallel
-        valid_hashes = [(h, hash_val) for h, hash_val in zip(heights, block_hashes) if hash_val]
-        if valid_hashes:
-            blocks_data = await asyncio.gather(*[bitcoin.get_block(hash_val) for _, hash_val in valid_hashes])
-
-            for (height, block_hash), block in zip(valid_hashes, blocks_data):
-                if block:
-                    new_blocks.append({
-                        'height': height,
-                        'hash': block_hash,
-                        'time': block.get('time', 0),
-                        'tx': block.get('nTx', 0),
-                        'size': block.get('size', 0) / 1024,
-                    })
+        results = await asyncio.gather(*[_fetch(h) for h in heights], return_exceptions=True)
+
+        for result in results:
+            height, block_hash, block = _ok(result, (None, None, None))
+            if block:
+                new_blocks.append(Block(
+                    height,
+                    block_hash,
+                    block.get('time', 0),
+                    block.get('nTx', 0),
+                    block.get('size', 0) * _INV_KB,
+                ))
 
         self.blocks = new_blocks
+        # Mark the height done only once every block arrived; a cancelled or partial
+        # fetch leaves it unset so the next tick retries at the same height
+        if len(new_blocks) == len(heights):
+            self.cached_height = current_height
         self.update_render()
 
     def update_render(self):
+        # Skip the rebuild when the block list is unchanged
+        render_key = tuple(self.blocks)
+        if render_key == self._render_key:
+            return
+        self._render_key = render_key
+
         table = Table.grid(padding=(0, 1))
         table.add_column(justify="right", style="cyan")
         table.add_column(justify="left", style="dim")
@@ -1099,32 +1651,47 @@ class RecentBlocksPanel(Static):
             table.add_row("", "[dim]No blocks yet[/]", "", "")
         else:
             for block in self.blocks:
-                block_time = datetime.fromtimestamp(block['time'])
-                time_str = block_time.strftime("%H:%M:%S")
-                hash_short = block['hash'][:8] + "..."
-
                 table.add_row(
-                    f"{block['height']:,}",
-                    f"{hash_short}",
-                    f"{block['tx']} txs",
-                    f"{block['size']:.0f} KB"
+                    f"{block.height:,}",
+                    f"{block.hash[:8]}...",
+                    f"{block.tx} txs",
+                    f"{block.size:.0f} KB"
                 )
 
-        panel = Panel(table, title="📦 Recent Blocks", border_style="cyan")
-        self.update(panel)
+        # Reuse the panel frame, only the table inside changes
+        self._panel.renderable = table
+        self.update(self._panel)
 
 
 class NetworkPanel(Static):
     """Display network connections and peer info"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__("⚠️  Waiting for network data...")
+        self._panel = Panel("", title="🌐 Network", border_style="green")
         self.network_info = None
         self.peer_info = None
+        self._render_key = None
 
     def update_data(self, network_info, peer_info):
         self.network_info = network_info
         self.peer_info = peer_info
+
+        # Skip the rebuild when nothing shown in the panel has changed
+        render_key = None
+        if network_info:
+            render_key = (
+                network_info.get("connections"),
+                network_info.get("connections_in"),
+                network_info.get("connections_out"),
+                network_info.get("subversion"),
+                tuple(peer.get("subver", "Unknown") for peer in peer_info or ()),
+            )
+        if render_key is not None and render_key == self._render_key:
+            return
+        self._render_key = render_key
         self.update_render()
 
     def update_render(self):
@@ -1137,11 +1704,7 @@ class NetworkPanel(Static):
         connections_out = self.network_info.get("connections_out", 0)
         subversion = self.network_info.get("subversion", "")
 
-        peer_versions = {}
-        if self.peer_info:
-            for peer in self.peer_info:
-                ver = peer.get("subver", "Unknown")
-                peer_versions[ver] = peer_versions.get(ver, 0) + 1
+        peer_versions = Counter(peer.get("subver", "Unknown") for peer in self.peer_info or ())
 
         table = Table.grid(padding=(0, 2))
         table.add_column(justify="left", style="cyan")
@@ -1155,22 +1718,39 @@ class NetworkPanel(Static):
         if peer_versions:
             table.add_row("", "")
             table.add_row("[dim]Peer Clients:[/]", "")
-            for ver, count in sorted(peer_versions.items(), key=lambda x: x[1], reverse=True)[:3]:
+            for ver, count in peer_versions.most_common(3):
                 table.add_row(f"  {ver[:30]}", f"{count}")
 
-        panel = Panel(table, title="🌐 Network", border_style="green")
-        self.update(panel)
+        # Reuse the panel frame, only the table inside changes
+        self._panel.renderable = table
+        self.update(self._panel)
 
 
 class StoragePanel(Static):
     """Display disk usage and pruning info"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__("⚠️  Waiting for storage data...")
+        self._panel = Panel("", title="💾 Storage", border_style="yellow")
         self.blockchain_info = None
+        self._render_key = None
 
     def update_data(self, blockchain_info):
         self.blockchain_info = blockchain_info
+
+        # Skip the rebuild when nothing shown in the panel has changed
+        render_key = None
+        if blockchain_info:
+            render_key = (
+                blockchain_info.get("size_on_disk"),
+                blockchain_info.get("pruned"),
+                blockchain_info.get("prune_target_size"),
+            )
+        if render_key is not None and render_key == self._render_key:
+            return
+        self._render_key = render_key
         self.update_render()
 
     def update_render(self):
@@ -1178,9 +1758,9 @@ class StoragePanel(Static):
             self.update("⚠️  Waiting for storage data...")
             return
 
-        size_on_disk = self.blockchain_info.get("size_on_disk", 0) / (1024**3)
+        size_on_disk = self.blockchain_info.get("size_on_disk", 0) * _INV_GB
         pruned = self.blockchain_info.get("pruned", False)
-        prune_target = self.blockchain_info.get("prune_target_size", 0) / (1024**3)
+        prune_target = self.blockchain_info.get("prune_target_size", 0) * _INV_GB
 
         table = Table.grid(padding=(0, 2))
         table.add_column(justify="left", style="cyan")
@@ -1190,30 +1770,56 @@ class StoragePanel(Static):
 
         if pruned and prune_target > 0:
             percentage = (size_on_disk / prune_target) * 100
-            bar_width = 30
-            filled = int((percentage / 100) * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
+            bar = _BAR30[min(30, int((percentage / 100) * 30))]
 
             table.add_row("Prune Limit:", f"[magenta]{prune_target:.1f} GB[/]")
             table.add_row("Usage:", f"[{bar}] {percentage:.1f}%")
         else:
             table.add_row("Mode:", "[green]Full Node[/]")
 
-        panel = Panel(table, title="💾 Storage", border_style="yellow")
-        self.update(panel)
+        # Reuse the panel frame, only the table inside changes
+        self._panel.renderable = table
+        self.update(self._panel)
 
 
 class MempoolPanel(Static):
     """Display mempool information"""
 
+    DEFAULT_CLASSES = "panel-static"
+
     def __init__(self):
         super().__init__("⚠️  Waiting for mempool data...")
+        self._panel = Panel("", title="📋 Mempool", border_style="magenta")
         self.mempool_info = None
         self.fee_estimates = {}
+        self._fee_rows = []
+        self._render_key = None
 
     def update_data(self, mempool_info, fee_estimates):
         self.mempool_info = mempool_info
         self.fee_estimates = fee_estimates
+
+        # Sort targets and convert BTC/kvB to sat/vB once per data change
+        self._fee_rows = [
+            (target, data["feerate"] * 100000)
+            for target, data in sorted((fee_estimates or {}).items())
+            if data and "feerate" in data
+        ]
+
+        # Skip the rebuild when nothing shown in the panel has changed
+        render_key = None
+        if mempool_info:
+            render_key = (
+                mempool_info.get("size"),
+                mempool_info.get("bytes"),
+                mempool_info.get("usage"),
+                mempool_info.get("maxmempool"),
+                bool(fee_estimates),
+                tuple(self._fee_rows),
+            )
+        if render_key is not None and render_key == self._render_key:
+            return
+        self._render_key = render_key
         self.update_render()
 
     def update_render(self):
@@ -1222,9 +1828,9 @@ class MempoolPanel(Static):
             return
 
         size = self.mempool_info.get("size", 0)
-        bytes_size = self.mempool_info.get("bytes", 0) / (1024**2)
-        usage = self.mempool_info.get("usage", 0) / (1024**2)
-        max_usage = self.mempool_info.get("maxmempool", 0) / (1024**2)
+        bytes_size = self.mempool_info.get("bytes", 0) * _INV_MB
+        usage = self.mempool_info.get("usage", 0) * _INV_MB
+        max_usage = self.mempool_info.get("maxmempool", 0) * _INV_MB
 
         table = Table.grid(padding=(0, 2))
         table.add_column(justify="left", style="cyan")
@@ -1238,19 +1844,43 @@ class MempoolPanel(Static):
             table.add_row("", "")
             table.add_row("[dim]Fee Estimates (sat/vB):[/]", "")
 
-            for target, data in sorted(self.fee_estimates.items()):
-                if data and "feerate" in data:
-                    feerate_btc_kb = data["feerate"]
-                    sat_vb = (feerate_btc_kb * 100000000) / 1000
-                    table.add_row(f"  {target} blocks:", f"[green]{sat_vb:.1f}[/]")
+            for target, sat_vb in self._fee_rows:
+                table.add_row(f"  {target} blocks:", f"[green]{sat_vb:.1f}[/]")
 
-        panel = Panel(table, title="📋 Mempool", border_style="magenta")
-        self.update(panel)
+        # Reuse the panel frame, only the table inside changes
+        self._panel.renderable = table
+        self.update(self._panel)
 
 
 class SettingsPanel(ScrollableContainer):
     """Display and edit Bitcoin node configuration"""
 
+    # (setting key, default, ((label id, value, text), ...)) for each option group
+    OPTION_GROUPS = (
+        ('prune', '0', (
+            ('prune-0', '0', 'Disable (Full Node)'),
+            ('prune-4096', '4096', '4 GB'),
+            ('prune-10240', '10240', '10 GB'),
+            ('prune-51200', '51200', '50 GB'),
+        )),
+        ('maxconnections', '125', (
+            ('maxconn-10', '10', '10'),
+            ('maxconn-25', '25', '25'),
+            ('maxconn-50', '50', '50'),
+            ('maxconn-125', '125', '125 (default)'),
+        )),
+        ('dbcache', '450', (
+            ('dbcache-300', '300', '300'),
+            ('dbcache-450', '450', '450 (default)'),
+            ('dbcache-1000', '1000', '1000'),
+            ('dbcache-2000', '2000', '2000'),
+        )),
+        ('server', '0', (
+            ('rpc-enable', '1', 'Enable RPC'),
+            ('rpc-disable', '0', 'Disable RPC'),
+        )),
+    )
+
     def __init__(self, config_manager, controller, alerts_panel):
         super().__init__()
         self.config_manager = config_manager
@@ -1259,6 +1889,31 @@ class SettingsPanel(ScrollableContainer):
         self.current_settings = {}
         self.pending_changes = {}
 
+        # (label id, is_selected) -> (normal, hover) texts, built once
+        self._label_texts = {}
+        for _, _, options in self.OPTION_GROUPS:
+            for i, (label_id, _, text) in enumerate(options):
+                prefix = '└' if i == len(options) - 1 else '├'
+                for is_selected in (False, True):
+                    symbol = "███" if is_selected else "▓▒░"
+                    color = "yellow" if is_selected else "cyan"
+                    self._label_texts[label_id, is_selected] = (
+                        f"  {prefix}─ [{color}][{symbol}][/{color}] {text}",
+                        f"  {prefix}─ [bold yellow][{symbol}][/bold yellow] [bold]{text}[/bold]",
+                    )
+
+        self._group_options = {key: options for key, _, options in self.OPTION_GROUPS}
+
+        # Value currently shown as selected for each setting key
+        self._selection = {}
+        self._labels = {}
+        self._render_pending = False
+
+    def _compose_options(self, key):
+        """Yield the option labels for a setting, all initially unselected"""
+        for label_id, _, _ in self._group_options[key]:
+            yield ClickableLabel(*self._label_texts[label_id, False], id=label_id)
+
     def compose(self) -> ComposeResult:
         """Create settings widgets"""
         yield Static("", id="settings-display")
@@ -1269,87 +1924,21 @@ class SettingsPanel(ScrollableContainer):
             with Vertical(classes="settings-column"):
                 # Pruned Mode options
                 yield Static("[dim green]┌─ PRUNED MODE[/]", classes="section-header")
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] Disable (Full Node)",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]Disable (Full Node)[/bold]",
-                    id="prune-0"
-                )
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 4 GB",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]4 GB[/bold]",
-                    id="prune-4096"
-                )
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 10 GB",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]10 GB[/bold]",
-                    id="prune-10240"
-                )
-                yield ClickableLabel(
-                    "  └─ [cyan][▓▒░][/cyan] 50 GB",
-                    "  └─ [bold yellow][▓▒░][/bold yellow] [bold]50 GB[/bold]",
-                    id="prune-51200"
-                )
+                yield from self._compose_options('prune')
 
                 # Max Connections options
                 yield Static("[dim green]┌─ MAX CONNECTIONS[/]", classes="section-header")
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 10",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]10[/bold]",
-                    id="maxconn-10"
-                )
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 25",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]25[/bold]",
-                    id="maxconn-25"
-                )
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 50",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]50[/bold]",
-                    id="maxconn-50"
-                )
-                yield ClickableLabel(
-                    "  └─ [cyan][▓▒░][/cyan] 125 (default)",
-                    "  └─ [bold yellow][▓▒░][/bold yellow] [bold]125 (default)[/bold]",
-                    id="maxconn-125"
-                )
+                yield from self._compose_options('maxconnections')
 
             # Right column
             with Vertical(classes="settings-column"):
                 # DB Cache options
                 yield Static("[dim green]┌─ DB CACHE (MB)[/]", classes="section-header")
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 300",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]300[/bold]",
-                    id="dbcache-300"
-                )
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 450 (default)",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]450 (default)[/bold]",
-                    id="dbcache-450"
-                )
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] 1000",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]1000[/bold]",
-                    id="dbcache-1000"
-                )
-                yield ClickableLabel(
-                    "  └─ [cyan][▓▒░][/cyan] 2000",
-                    "  └─ [bold yellow][▓▒░][/bold yellow] [bold]2000[/bold]",
-                    id="dbcache-2000"
-                )
+                yield from self._compose_options('dbcache')
 
                 # RPC Server options
                 yield Static("[dim green]┌─ RPC SERVER[/]", classes="section-header")
-                yield ClickableLabel(
-                    "  ├─ [cyan][▓▒░][/cyan] Enable RPC",
-                    "  ├─ [bold yellow][▓▒░][/bold yellow] [bold]Enable RPC[/bold]",
-                    id="rpc-enable"
-                )
-                yield ClickableLabel(
-                    "  └─ [cyan][▓▒░][/cyan] Disable RPC",
-                    "  └─ [bold yellow][▓▒░][/bold yellow] [bold]Disable RPC[/bold]",
-                    id="rpc-disable"
-                )
+                yield from self._compose_options('server')
 
         # Action buttons (full width)
         yield Static("[dim green]┌─ ACTIONS[/]", classes="section-header")
@@ -1370,7 +1959,12 @@ class SettingsPanel(ScrollableContainer):
         )
 
     def on_mount(self) -> None:
-        """Load config on mount"""
+        """Resolve option labels and load config on mount"""
+        self._labels = {
+            label_id: self.query_one(f"#{label_id}", ClickableLabel)
+            for _, _, options in self.OPTION_GROUPS
+            for label_id, _, _ in options
+        }
         self.load_config()
 
     def load_config(self) -> None:
@@ -1470,73 +2064,37 @@ class SettingsPanel(ScrollableContainer):
         self.update_option_labels()
 
     def update_option_labels(self) -> None:
-        """Update all option labels to show selected state"""
-        # Get current or pending values
-        prune = self.pending_changes.get('prune', self.current_settings.get('prune', '0'))
-        maxconn = self.pending_changes.get('maxconnections', self.current_settings.get('maxconnections', '125'))
-        dbcache = self.pending_changes.get('dbcache', self.current_settings.get('dbcache', '450'))
-        server = self.pending_changes.get('server', self.current_settings.get('server', '0'))
+        """Update option labels whose selected state changed"""
+        for key, default, options in self.OPTION_GROUPS:
+            # Get current or pending value
+            value = self.pending_changes.get(key, self.current_settings.get(key, default))
+            previous = self._selection.get(key)
+            if value == previous:
+                continue
+            self._selection[key] = value
 
-        # Update Pruned Mode labels
-        text_map = {'0': 'Disable (Full Node)', '4096': '4 GB', '10240': '10 GB', '51200': '50 GB'}
-        for value in ['0', '4096', '10240', '51200']:
-            label = self.query_one(f"#prune-{value}", ClickableLabel)
-            is_selected = (prune == value)
-            symbol = "███" if is_selected else "▓▒░"
-            color = "yellow" if is_selected else "cyan"
-            prefix = '├' if value != '51200' else '└'
-            text = text_map[value]
-
-            normal = f"  {prefix}─ [{color}][{symbol}][/{color}] {text}"
-            hover = f"  {prefix}─ [bold yellow][{symbol}][/bold yellow] [bold]{text}[/bold]"
-            label.set_texts(normal, hover)
-
-        # Update Max Connections labels
-        for value in ['10', '25', '50', '125']:
-            label = self.query_one(f"#maxconn-{value}", ClickableLabel)
-            is_selected = (maxconn == value)
-            symbol = "███" if is_selected else "▓▒░"
-            color = "yellow" if is_selected else "cyan"
-            prefix = '├' if value != '125' else '└'
-            text = value + (" (default)" if value == '125' else "")
-
-            normal = f"  {prefix}─ [{color}][{symbol}][/{color}] {text}"
-            hover = f"  {prefix}─ [bold yellow][{symbol}][/bold yellow] [bold]{text}[/bold]"
-            label.set_texts(normal, hover)
-
-        # Update DB Cache labels
-        for value in ['300', '450', '1000', '2000']:
-            label = self.query_one(f"#dbcache-{value}", ClickableLabel)
-            is_selected = (dbcache == value)
-            symbol = "███" if is_selected else "▓▒░"
-            color = "yellow" if is_selected else "cyan"
-            prefix = '├' if value != '2000' else '└'
-            text = value + (" (default)" if value == '450' else "")
-
-            normal = f"  {prefix}─ [{color}][{symbol}][/{color}] {text}"
-            hover = f"  {prefix}─ [bold yellow][{symbol}][/bold yellow] [bold]{text}[/bold]"
-            label.set_texts(normal, hover)
-
-        # Update RPC Server labels
-        enable_label = self.query_one("#rpc-enable", ClickableLabel)
-        disable_label = self.query_one("#rpc-disable", ClickableLabel)
-
-        enable_selected = (server == '1')
-        disable_selected = (server == '0')
-
-        enable_symbol = "███" if enable_selected else "▓▒░"
-        disable_symbol = "███" if disable_selected else "▓▒░"
-        enable_color = "yellow" if enable_selected else "cyan"
-        disable_color = "yellow" if disable_selected else "cyan"
-
-        enable_label.set_texts(
-            f"  ├─ [{enable_color}][{enable_symbol}][/{enable_color}] Enable RPC",
-            f"  ├─ [bold yellow][{enable_symbol}][/bold yellow] [bold]Enable RPC[/bold]"
-        )
-        disable_label.set_texts(
-            f"  └─ [{disable_color}][{disable_symbol}][/{disable_color}] Disable RPC",
-            f"  └─ [bold yellow][{disable_symbol}][/bold yellow] [bold]Disable RPC[/bold]"
-        )
+            # Only the newly selected and previously selected labels flip
+            for label_id, option_value, _ in options:
+                if option_value == value or option_value == previous:
+                    self._labels[label_id].set_texts(*self._label_texts[label_id, option_value == value])
+
+    def _schedule_render(self) -> None:
+        """Coalesce a burst of option clicks into a single display update"""
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.set_timer(0.03, self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_pending = False
+        self.update_display()
+
+    def _run_config_worker(self, work) -> None:
+        """Run an apply/reset worker unless one is already in flight"""
+        # Cancelling instead could interrupt a node restart between stop and start
+        if any(worker.group == "config-apply" and not worker.is_finished for worker in self.workers):
+            return
+        self.run_worker(work, group="config-apply")
 
     async def on_click(self, event) -> None:
         """Handle label clicks"""
@@ -1550,33 +2108,33 @@ class SettingsPanel(ScrollableContainer):
         if label_id and label_id.startswith("prune-"):
             prune_value = label_id.split("-")[1]
             self.pending_changes['prune'] = prune_value
-            self.update_display()
+            self._schedule_render()
 
         # Max Connections
         elif label_id and label_id.startswith("maxconn-"):
             maxconn_value = label_id.split("-")[1]
             self.pending_changes['maxconnections'] = maxconn_value
-            self.update_display()
+            self._schedule_render()
 
         # DB Cache
         elif label_id and label_id.startswith("dbcache-"):
             dbcache_value = label_id.split("-")[1]
             self.pending_changes['dbcache'] = dbcache_value
-            self.update_display()
+            self._schedule_render()
 
         # RPC Server
         elif label_id == "rpc-enable":
             self.pending_changes['server'] = '1'
-            self.update_display()
+            self._schedule_render()
         elif label_id == "rpc-disable":
             self.pending_changes['server'] = '0'
-            self.update_display()
+            self._schedule_render()
 
         # Action buttons
         elif label_id == "action-apply":
-            self.run_worker(self.apply_changes())
+            self._run_config_worker(self.apply_changes)
         elif label_id == "action-reset":
-            self.run_worker(self.reset_to_defaults())
+            self._run_config_worker(self.reset_to_defaults)
         elif label_id == "action-reload":
             self.load_config()
             if self.alerts_panel:
@@ -1613,7 +2171,7 @@ class SettingsPanel(ScrollableContainer):
         new_settings = {**self.current_settings, **self.pending_changes}
 
         # Write to file
-        success, message = self.config_manager.write_config(new_settings)
+        success, message = await asyncio.to_thread(self.config_manager.write_config, new_settings)
 
         if success:
             if self.alerts_panel:
@@ -1665,7 +2223,7 @@ class SettingsPanel(ScrollableContainer):
             return
 
         defaults = self.config_manager.get_default_settings()
-        success, message = self.config_manager.write_config(defaults)
+        success, message = await asyncio.to_thread(self.config_manager.write_config, defaults)
 
         if success:
             if self.alerts_panel:
@@ -1686,35 +2244,17 @@ class NodePulseApp(App):
         align: center top;
     }
 
-    #home-container > Static,
-    #sync-container > Static,
-    #blockchain-container > Static {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
     #controls, #settings {
         align: center top;
         padding: 2;
         overflow-y: auto;
     }
 
-    #controls > Static, #settings > Static {
+    .panel-static {
         width: 100%;
         margin-bottom: 1;
     }
 
-    #controls > Label, #settings > Label,
-    #controls > ClickableLabel, #settings > ClickableLabel {
-        width: 100%;
-        padding: 0 2;
-    }
-
-    #controls > Label:hover, #settings > Label:hover,
-    #controls > ClickableLabel:hover, #settings > ClickableLabel:hover {
-        background: $accent-darken-2;
-    }
-
     .section-header {
         width: 100%;
         margin-top: 1;
@@ -1733,6 +2273,30 @@ class NodePulseApp(App):
     }
     """
 
+    # Snapshot fields each tab needs; blockchain and network are always
+    # fetched because the sync and peer-count alerts depend on them
+    TAB_RPC_DEPS = {
+        "home": {"blockchain", "network", "uptime"},
+        "sync": {"blockchain", "network"},
+        "blockchain": {"blockchain", "network", "peers", "mempool", "fee_1", "fee_3", "fee_6"},
+        "controls": {"blockchain", "network"},
+        "settings": {"blockchain", "network"},
+    }
+
+    # Seconds between refreshes: fast while syncing, slow on tabs without node data
+    REFRESH_INTERVAL = 10.0
+    REFRESH_INTERVAL_SYNCING = 2.0
+    REFRESH_INTERVAL_IDLE = 30.0
+    IDLE_TABS = {"controls", "settings"}
+    REFRESH_TIMEOUT = 8.0
+    MANUAL_REFRESH_DEBOUNCE = 0.5
+
+    # Node responsiveness -> (_emit_alert key, message, level) raised on entering that state
+    STATE_ALERT = {
+        True: ("node_up", "Node connection restored", "success"),
+        False: ("node_down", "Node not responding!", "error"),
+    }
+
     BINDINGS = [
         Binding("q", "quit", "Quit", show=True),
         Binding("r", "refresh", "Refresh Now", show=True),
@@ -1751,6 +2315,7 @@ class NodePulseApp(App):
         self.config_manager = BitcoinConfigManager()
 
         # Panels - will be created in compose
+        self.tabbed_content = None
         self.dashboard_panel = None
         self.sync_panel = None
         self.sync_stats_panel = None
@@ -1766,6 +2331,12 @@ class NodePulseApp(App):
         self.last_peer_count = None
         self.last_blocks = None
         self.node_was_responsive = True
+        self._refresh_timer = None
+        self._alert_throttle = {}
+        self._last_manual_refresh = 0.0
+        self._tab_handlers = {}
+        self._snapshot_path = NODEPULSE_SNAPSHOT_PATH
+        self._snapshot_uptime = 0
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -1806,6 +2377,7 @@ class NodePulseApp(App):
         self.sub_title = "v1.3 - Dashboard + Monitoring + Controls"
 
         # Get references to panels after they're mounted
+        self.tabbed_content = self.query_one(TabbedContent)
         self.dashboard_panel = self.query_one(DashboardPanel)
         self.sync_panel = self.query_one(SyncPanel)
         self.sync_stats_panel = self.query_one(SyncStatsPanel)
@@ -1817,6 +2389,13 @@ class NodePulseApp(App):
         self.controls_panel = self.query_one(ControlsPanel)
         self.settings_panel = self.query_one(SettingsPanel)
 
+        # Tab -> panel updates that need a responding node (the dashboard
+        # also shows the node-down state, so refresh_data updates it directly)
+        self._tab_handlers = {
+            "sync": self._update_sync_tab,
+            "blockchain": self._update_blockchain_tab,
+        }
+
         # Update controls and settings panels with alerts reference
         self.controls_panel.alerts_panel = self.alerts_panel
         self.settings_panel.alerts_panel = self.alerts_panel
@@ -1829,58 +2408,105 @@ class NodePulseApp(App):
             self.alerts_panel.add_alert("Bitcoin CLI not detected - check configuration", "warning")
 
         self.alerts_panel.add_alert("NodePulse v1.3 started", "success")
-        self.run_worker(self.refresh_data(), exclusive=True)
-        self.set_interval(10, lambda: self.run_worker(self.refresh_data(), exclusive=True))
+
+        # Paint the dashboard from the previous session while the first refresh is in flight
+        saved = self._load_snapshot()
+        if saved:
+            self._snapshot_uptime = saved.get("u") or 0
+            self.dashboard_panel.update_data(False, saved.get("b"), saved.get("n"), self._snapshot_uptime)
+
+        self.run_worker(self._refresh_and_reschedule(), exclusive=True)
+
+    def _load_snapshot(self):
+        """Read the snapshot saved by a previous session, or None"""
+        try:
+            saved = _json_loads(self._snapshot_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return saved if isinstance(saved, dict) else None
+
+    def _save_snapshot(self, blockchain_info, network_info, uptime) -> None:
+        """Write the latest dashboard data for the next startup"""
+        tmp_path = self._snapshot_path.with_name(self._snapshot_path.name + ".tmp")
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(_json_dumps({"b": blockchain_info, "n": network_info, "u": uptime}))
+            os.replace(tmp_path, self._snapshot_path)
+        except OSError:
+            pass
+
+    def _emit_alert(self, key, message, level, min_interval=60.0) -> None:
+        """Add an alert unless the same kind was raised within min_interval seconds"""
+        now = time.monotonic()
+        last = self._alert_throttle.get(key)
+        if last is not None and now - last < min_interval:
+            return
+        self._alert_throttle[key] = now
+        self.alerts_panel.add_alert(message, level)
+
+    def _schedule_refresh(self) -> None:
+        """(Re)arm the refresh timer based on sync state and the active tab"""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+
+        if self.tracker.was_syncing:
+            interval = self.REFRESH_INTERVAL_SYNCING
+        elif self.tabbed_content.active in self.IDLE_TABS:
+            interval = self.REFRESH_INTERVAL_IDLE
+        else:
+            interval = self.REFRESH_INTERVAL
+
+        self._refresh_timer = self.set_timer(
+            interval, lambda: self.run_worker(self._refresh_and_reschedule(), exclusive=True)
+        )
+
+    async def _refresh_and_reschedule(self) -> None:
+        # Workers are exclusive, so a new refresh cancels a stale one; the
+        # timeout keeps a hung RPC from blocking every refresh after it
+        try:
+            await asyncio.wait_for(self.refresh_data(), timeout=self.REFRESH_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._emit_alert("refresh_timeout", "Refresh timed out - node is slow to respond", "warning")
+        except asyncio.CancelledError:
+            # Superseded by a newer refresh, which re-arms the timer itself; arming it
+            # here would fire mid-way through that refresh and cancel it in turn
+            raise
+        self._schedule_refresh()
 
     async def refresh_data(self) -> None:
         """Refresh node data using async calls and parallelization"""
         # Get active tab to only update visible panels
-        tabbed_content = self.query_one(TabbedContent)
-        active_tab = tabbed_content.active
-
-        node_running = self.controller.is_running()
-
-        # Parallelize main RPC calls
-        blockchain_info, network_info, peer_info, mempool_info, uptime = await asyncio.gather(
-            self.bitcoin.get_blockchain_info(),
-            self.bitcoin.get_network_info(),
-            self.bitcoin.get_peer_info(),
-            self.bitcoin.get_mempool_info(),
-            self.bitcoin.get_uptime(),
-            return_exceptions=True
-        )
+        active_tab = self.tabbed_content.active
 
-        # Handle exceptions
-        if isinstance(blockchain_info, Exception):
-            blockchain_info = None
-        if isinstance(network_info, Exception):
-            network_info = None
-        if isinstance(peer_info, Exception):
-            peer_info = None
-        if isinstance(mempool_info, Exception):
-            mempool_info = None
-        if isinstance(uptime, Exception):
-            uptime = 0
+        # Cached for a couple of seconds; a miss scans processes, so keep it off the loop
+        node_running = await asyncio.to_thread(self.controller.is_running)
+
+        # Fetch only the RPC data the active tab needs, in a single batched request
+        snapshot = await self.bitcoin.get_dashboard_snapshot(self.TAB_RPC_DEPS.get(active_tab))
+        blockchain_info = snapshot['blockchain']
+        network_info = snapshot['network']
+        uptime = snapshot['uptime'] or 0
 
         # Always update Dashboard panel (visible on 'home' tab)
         if active_tab == "home":
             self.dashboard_panel.update_data(node_running, blockchain_info, network_info, uptime)
 
-        if blockchain_info is None:
-            if self.node_was_responsive:
-                self.alerts_panel.add_alert("Node not responding!", "error")
-                self.node_was_responsive = False
+        responsive = blockchain_info is not None
+        if responsive != self.node_was_responsive:
+            self._emit_alert(*self.STATE_ALERT[responsive])
+            self.node_was_responsive = responsive
+        if not responsive:
             return
-        else:
-            if not self.node_was_responsive:
-                self.alerts_panel.add_alert("Node connection restored", "success")
-                self.node_was_responsive = True
 
-        blocks = blockchain_info.get("blocks", 0)
-        headers = blockchain_info.get("headers", 0)
-        is_syncing = blockchain_info.get("initialblockdownload", False)
+        if network_info:
+            # Uptime is only fetched on the dashboard tab; elsewhere keep the last real value
+            if snapshot['uptime'] is not None:
+                self._snapshot_uptime = snapshot['uptime']
+            await asyncio.to_thread(self._save_snapshot, blockchain_info, network_info, self._snapshot_uptime)
+
+        chain = BlockchainSnapshot.from_rpc(blockchain_info)
 
-        sync_completed = self.tracker.update(blocks, headers, is_syncing)
+        sync_completed = self.tracker.update(chain.blocks, chain.headers, chain.is_syncing)
         if sync_completed:
             self.alerts_panel.add_alert("Blockchain sync completed! 🎉", "success")
 
@@ -1888,60 +2514,85 @@ class NodePulseApp(App):
             peer_count = network_info.get("connections", 0)
             if self.last_peer_count is not None:
                 if peer_count < 3 and self.last_peer_count >= 3:
-                    self.alerts_panel.add_alert(f"Low peer count: {peer_count}", "warning")
+                    self._emit_alert("low_peers", f"Low peer count: {peer_count}", "warning")
                 elif peer_count >= 3 and self.last_peer_count < 3:
-                    self.alerts_panel.add_alert(f"Peer count recovered: {peer_count}", "success")
+                    self._emit_alert("peers_ok", f"Peer count recovered: {peer_count}", "success")
             self.last_peer_count = peer_count
 
         # Only update panels if their tab is active
-        if active_tab == "sync":
-            if blockchain_info:
-                self.sync_panel.update_data(blockchain_info)
-                self.sync_stats_panel.update_data(self.tracker, blockchain_info)
-
-        if active_tab == "blockchain":
-            # Parallelize fee estimates
-            fee_estimates_data = await asyncio.gather(
-                self.bitcoin.estimate_smart_fee(1),
-                self.bitcoin.estimate_smart_fee(3),
-                self.bitcoin.estimate_smart_fee(6),
-                return_exceptions=True
-            )
-            fee_estimates = {
-                1: fee_estimates_data[0] if not isinstance(fee_estimates_data[0], Exception) else None,
-                3: fee_estimates_data[1] if not isinstance(fee_estimates_data[1], Exception) else None,
-                6: fee_estimates_data[2] if not isinstance(fee_estimates_data[2], Exception) else None
-            }
+        handler = self._tab_handlers.get(active_tab)
+        if handler:
+            await handler(snapshot)
 
-            if blockchain_info:
-                self.storage_panel.update_data(blockchain_info)
+    async def _update_sync_tab(self, snapshot) -> None:
+        blockchain_info = snapshot['blockchain']
+        self.sync_panel.update_data(blockchain_info)
+        self.sync_stats_panel.update_data(self.tracker, blockchain_info)
 
-                if not hasattr(self, '_block_refresh_counter'):
-                    self._block_refresh_counter = 0
-                self._block_refresh_counter += 1
-                if self._block_refresh_counter % 3 == 0:  # Reduced frequency
-                    await self.recent_blocks_panel.update_data(self.bitcoin, blocks)
+    async def _update_blockchain_tab(self, snapshot) -> None:
+        blockchain_info = snapshot['blockchain']
+        network_info = snapshot['network']
+        mempool_info = snapshot['mempool']
 
-            if network_info:
-                self.network_panel.update_data(network_info, peer_info)
+        # Fee estimates arrive in the same batch as the rest of the snapshot
+        fee_estimates = {target: snapshot[f'fee_{target}'] for target in (1, 3, 6)}
 
-            if mempool_info:
-                self.mempool_panel.update_data(mempool_info, fee_estimates)
+        self.storage_panel.update_data(blockchain_info)
+
+        if network_info:
+            self.network_panel.update_data(network_info, snapshot['peers'])
+
+        if mempool_info:
+            self.mempool_panel.update_data(mempool_info, fee_estimates)
+
+        # Only hits the node when the chain tip height has changed
+        await self.recent_blocks_panel.update_data(self.bitcoin, blockchain_info.get("blocks", 0))
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Render panels that changed while their tab was hidden"""
+        if self.alerts_panel._dirty and event.pane.id == "sync":
+            self.alerts_panel.update_render()
+        if self.controls_panel._dirty and event.pane.id == "controls":
+            self.controls_panel.run_worker(self.controls_panel.update_status(), exclusive=True)
+
+        # Only the active tab's RPC data is fetched, so refresh now rather than
+        # waiting out the countdown; this also re-arms the timer for the new tab
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self.run_worker(self._refresh_and_reschedule(), exclusive=True)
+
+    async def on_unmount(self) -> None:
+        await self.bitcoin.close()
 
     def action_refresh(self) -> None:
+        # Ignore key repeats / double clicks; the refresh already running covers them
+        now = time.monotonic()
+        if now - self._last_manual_refresh < self.MANUAL_REFRESH_DEBOUNCE:
+            return
+        self._last_manual_refresh = now
+
         self.alerts_panel.add_alert("Manual refresh triggered", "info")
-        self.run_worker(self.refresh_data(), exclusive=True)
+        self.bitcoin.cache_invalidate()
+        self.controller.invalidate_running_cache()
+        self.run_worker(self._refresh_and_reschedule(), exclusive=True)
 
     def action_switch_tab(self, tab_id: str) -> None:
         """Switch to a specific tab"""
-        tabbed_content = self.query_one(TabbedContent)
-        tabbed_content.active = tab_id
+        self.tabbed_content.active = tab_id
 
 
 def main():
     """Entry point for NodePulse"""
     app = NodePulseApp()
-    app.run()
+    if uvloop is None:
+        app.run()
+        return
+
+    loop = uvloop.new_event_loop()
+    try:
+        app.run(loop=loop)
+    finally:
+        loop.close()
 
 
 if __name__ == "__main__":